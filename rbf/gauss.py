@@ -451,7 +451,7 @@ def covariance_differentiator(delta):
     '''The actual decorator'''
     def fout(x1, x2, diff1, diff2):
       '''The returned differentiable mean function'''
-      if (not any(diff1)) & (not any(diff2)):
+      if (not any(diff1)) and (not any(diff2)):
         # If no derivatives are specified then return the undifferentiated
         # covariance.
         return as_sparse_or_array(fin(x1, x2))
@@ -499,7 +499,7 @@ def _combined_dim(dim1, dim2):
   be an `int` or `None` indicating that it is unspecified
   '''
   # If both dimensions are unspecified, return None
-  if (dim1 is None) & (dim2 is None):
+  if (dim1 is None) and (dim2 is None):
     return None
 
   # At least one dimension is specified. If only one dimension is specified
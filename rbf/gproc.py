@@ -385,7 +385,7 @@ def covariance_differentiator(delta):
     def _covariance_differentiator(fin):
         @wraps(fin)
         def fout(x1, x2, diff1, diff2):
-            if (not any(diff1)) & (not any(diff2)):
+            if (not any(diff1)) and (not any(diff2)):
                 return as_sparse_or_array(fin(x1, x2))
 
             elif any(diff1):
@@ -1038,7 +1038,7 @@ class GaussianProcess:
                  variance=None,
                  dim=None,
                  differentiable=False):
-        if (covariance is None) & (variance is not None):
+        if (covariance is None) and (variance is not None):
             raise ValueError(
                 '`variance` cannot be specified if `covariance` is not '
                 'specified'
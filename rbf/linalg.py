@@ -290,7 +290,9 @@ class _SparsePosDefSolver:
     def L(self):
         '''Return the factorization `L`.'''
         L = self.factor.L()
-        p_inv = np.argsort(self.p)
+        # invert the permutation with a scatter rather than a sort
+        p_inv = np.empty(self.p.shape[0], dtype=int)
+        p_inv[self.p] = np.arange(self.p.shape[0])
         out = L[p_inv]
         return out
 
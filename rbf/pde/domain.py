@@ -294,7 +294,10 @@ class Domain(object):
 
         out_smpid = np.full(n, -1, dtype=int)
         out_points = np.array(points, copy=True)
-        nbr_dist = KDTree(points).query(points, 2)[0][:, 1]
+        # this tree is only queried once, so favor build speed over query
+        # speed
+        tree = KDTree(points, balanced_tree=False, compact_nodes=False)
+        nbr_dist = tree.query(points, 2)[0][:, 1]
         snap_dist = delta*nbr_dist
 
         if self.rtree is None:
@@ -302,12 +305,13 @@ class Domain(object):
                 points,
                 self.vertices,
                 self.simplices)
-            nrst_dist = np.linalg.norm(nrst_pnt - points, axis=1)
-            snap = nrst_dist < snap_dist
-            out_points[snap] = nrst_pnt[snap]
-            out_smpid[snap] = nrst_smpid[snap]
 
         else:
+            # find the nearest point on the boundary for each point. Points
+            # that have no simplices within their snapping distance are given
+            # a simplex index of -1
+            nrst_pnt = np.array(points, copy=True)
+            nrst_smpid = np.full(n, -1, dtype=int)
             # creating bounding boxes around the snapping regions for
             # each point
             bounds = np.hstack((points - snap_dist[:, None],
@@ -324,16 +328,21 @@ class Domain(object):
                 
                 # get the nearest point to the potential simplices and
                 # the simplex containing the nearest point
-                nrst_pnt, nrst_smpid = geo.nearest_point(
+                pnt, smpid = geo.nearest_point(
                     points[[i]],
                     self.vertices,
                     self.simplices[potential_smpid])
-                nrst_dist = np.linalg.norm(points[i] - nrst_pnt[0])
-                # if the nearest point is within the snapping distance
-                # then snap
-                if nrst_dist < snap_dist[i]:
-                    out_points[i] = nrst_pnt[0]
-                    out_smpid[i] = potential_smpid[nrst_smpid[0]]
+                nrst_pnt[i] = pnt[0]
+                nrst_smpid[i] = potential_smpid[smpid[0]]
+
+        # snap the points whose nearest point on the boundary is within the
+        # snapping distance. Compare squared distances to avoid taking square
+        # roots
+        diff = nrst_pnt - points
+        nrst_sqdist = np.einsum('ij,ij->i', diff, diff)
+        snap = (nrst_smpid >= 0) & (nrst_sqdist < snap_dist**2)
+        out_points[snap] = nrst_pnt[snap]
+        out_smpid[snap] = nrst_smpid[snap]
 
         return out_points, out_smpid
     
@@ -10,7 +10,7 @@ import scipy.sparse as sp
 
 from rbf.basis import phs3, get_rbf
 from rbf.poly import monomial_count, monomial_powers, mvmonos
-from rbf.utils import assert_shape, KDTree
+from rbf.utils import assert_shape, assert_neighbor_count, KDTree
 from rbf.linalg import as_array
 
 logger = logging.getLogger(__name__)
@@ -242,6 +242,8 @@ def weight_matrix(x, p, n, diffs,
 
     p = np.asarray(p, dtype=float)
     assert_shape(p, (None, ndim), 'p')
+    # check the stencil size before building the KD-tree or any other arrays
+    assert_neighbor_count(n, p.shape[0])
 
     diffs = np.asarray(diffs, dtype=int)
     diffs = np.atleast_2d(diffs)
@@ -253,10 +255,14 @@ def weight_matrix(x, p, n, diffs,
         coeffs = np.asarray(coeffs, dtype=float)
         assert_shape(coeffs, (len(diffs), ...), 'coeffs')
 
-    # broadcast each element in `coeffs` to the length of `x`
-    coeffs = np.array([np.broadcast_to(c, (nx,)) for c in coeffs])
+    # broadcast each element in `coeffs` to the length of `x`. This is a view,
+    # so the coefficients are not copied for each target point
+    if coeffs.ndim == 1:
+        coeffs = coeffs[:, None]
 
-    _, stencils = KDTree(p).query(x, n)
+    coeffs = np.broadcast_to(coeffs, (len(diffs), nx))
+
+    _, stencils = KDTree(p).query(x, n, workers=-1)
     if chunk_size is None:
         data = weights(
             x, p[stencils], diffs,
@@ -276,7 +282,7 @@ def weight_matrix(x, p, n, diffs,
                 eps=eps)
 
     data = data.ravel()
-    rows = np.repeat(range(nx), n)
+    rows = np.repeat(np.arange(nx), n)
     cols = stencils.ravel()
     out = sp.coo_matrix((data, (rows, cols)), (nx, len(p)))
     return out
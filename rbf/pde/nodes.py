@@ -30,7 +30,7 @@ def _disperse_step(nodes, rho, fixed_nodes, neighbors, delta):
 
     all_nodes = np.vstack((nodes, fixed_nodes))
     # find index and distance to nearest nodes
-    dist, idx = KDTree(all_nodes).query(nodes, neighbors + 1)
+    dist, idx = KDTree(all_nodes).query(nodes, neighbors + 1, workers=-1)
     # dont consider a node to be one of its own nearest neighbors
     dist, idx = dist[:, 1:], idx[:, 1:]
     # compute the force proportionality constant between each node
@@ -204,7 +204,7 @@ def neighbor_argsort(nodes, m=None):
 
     m = min(m, nodes.shape[0])
     # find the indices of the nearest m nodes for each node
-    _, idx = KDTree(nodes).query(nodes, m)
+    _, idx = KDTree(nodes).query(nodes, m, workers=-1)
     # efficiently form adjacency matrix
     col = idx.ravel()
     row = np.repeat(np.arange(nodes.shape[0]), m)
@@ -226,7 +226,9 @@ def _check_spacing(nodes, rho=None):
             return np.ones(x.shape[0])
 
     # distance to nearest neighbor
-    dist = KDTree(nodes).query(nodes, 2)[0][:, 1]
+    # this tree is only queried once, so favor build speed over query speed
+    tree = KDTree(nodes, balanced_tree=False, compact_nodes=False)
+    dist = tree.query(nodes, 2)[0][:, 1]
     dist_is_zero = (dist == 0.0)
     if np.any(dist_is_zero):
         indices, = dist_is_zero.nonzero()
@@ -457,7 +459,11 @@ def prepare_nodes(nodes, domain,
     logger.debug('Done')
 
     logger.debug('Creating ghost nodes...')
-    tree = KDTree(nodes)
+    # the KD-tree is built once from the nodes before any ghosts are appended,
+    # and it is only needed if there are ghost nodes to create
+    if boundary_groups_with_ghosts:
+        tree = KDTree(nodes)
+
     for bnd_name in boundary_groups_with_ghosts:
         bnd_idx = groups['boundary:%s' % bnd_name]
         spacing = ghost_delta*tree.query(nodes[bnd_idx], 2)[0][:, 1]
@@ -474,7 +480,9 @@ def prepare_nodes(nodes, domain,
     sort_idx = neighbor_argsort(nodes)
     nodes = nodes[sort_idx]
     normals = normals[sort_idx]
-    reverse_sort_idx = np.argsort(sort_idx)
+    # invert the permutation with a scatter rather than a sort
+    reverse_sort_idx = np.empty(sort_idx.shape[0], dtype=int)
+    reverse_sort_idx[sort_idx] = np.arange(sort_idx.shape[0])
     groups = {k: reverse_sort_idx[v] for k, v in groups.items()}
     logger.debug('Done')
 
@@ -128,7 +128,7 @@ def get_arg_count(func):
         # if a parameter has kind 0 then it is a a positional only argument and
         # if kind is 1 then it is a positional or keyword argument. Count the
         # 0's and 1's
-        out = sum((p.kind == 0) | (p.kind == 1) for p in params.values())
+        out = sum((p.kind == 0) or (p.kind == 1) for p in params.values())
         return out
 
 
@@ -215,19 +215,40 @@ def clear_memoize_caches():
             inst().clear_cache()
 
 
+def assert_neighbor_count(k, n):
+    '''
+    Raises a ValueError if `k` nearest neighbors cannot be found among `n`
+    points
+
+    Parameters
+    ----------
+    k : int
+        Number of nearest neighbors
+
+    n : int
+        Number of points being searched
+
+    '''
+    if k < 1:
+        raise ValueError(
+            'The number of nearest points must be positive, got %s' % k)
+
+    if k > n:
+        raise ValueError(
+            'Cannot find the %s nearest points among a set of %s points'
+            % (k, n))
+
+
 class KDTree(cKDTree):
     '''
     Same as `scipy.spatial.cKDTree`, except when calling `query` with `k=1`,
     the output does not get squeezed to 1D. Also, an error will be raised if
-    `query` is called with `k` larger than the number of points in the tree.
+    `query` is called with `k` larger than the number of points in the tree
+    or with a non-positive `k`.
     '''
     def query(self, x, k=1, **kwargs):
         '''query the KD-tree for nearest neighbors'''
-        if k > self.n:
-            raise ValueError(
-                'Cannot find the %s nearest points among a set of %s points'
-                % (k, self.n))
-
+        assert_neighbor_count(k, self.n)
         dist, indices = cKDTree.query(self, x, k=k, **kwargs)
         if k == 1:
             dist = dist[..., None]
@@ -177,3 +177,11 @@ class Test(unittest.TestCase):
     w = rbf.pde.fd.weights(x,nodes,(0,1),
                        phi=rbf.basis.phs8)
     self.assertTrue(np.isclose(u.dot(w),diff_true,atol=1e-2))
+
+  def test_weight_matrix_stencil_size(self):
+    x = np.random.random((5,2))
+    p = np.random.random((10,2))
+    # the stencil size cannot exceed the number of source points
+    self.assertRaises(ValueError, rbf.pde.fd.weight_matrix, x, p, 11, (1,0))
+    # the stencil size must be positive
+    self.assertRaises(ValueError, rbf.pde.fd.weight_matrix, x, p, 0, (1,0))
@@ -83,6 +83,39 @@ class Test(unittest.TestCase):
     # clear the cache and make sure the cache size goes back to zero
     rbf.utils.clear_memoize_caches()
     self.assertTrue(len(memfunc.cache) == 0)
+
+  def test_kdtree(self):
+    np.random.seed(1)
+    pnts = np.random.random((100,2))
+    x = np.random.random((20,2))
+    # the default tree and an unbalanced, uncompacted tree should give the
+    # same neighbors
+    dist1, idx1 = rbf.utils.KDTree(pnts).query(x, 3)
+    dist2, idx2 = rbf.utils.KDTree(
+      pnts, balanced_tree=False, compact_nodes=False).query(x, 3)
+    self.assertTrue(np.all(idx1 == idx2))
+    self.assertTrue(np.allclose(dist1, dist2))
+    # the second positional argument should still be the leaf size
+    tree = rbf.utils.KDTree(pnts, 32)
+    self.assertTrue(tree.leafsize == 32)
+    # the output should not be squeezed when k is 1
+    dist, idx = tree.query(x, 1)
+    self.assertTrue(dist.shape == (20,1))
+    self.assertTrue(idx.shape == (20,1))
+    # k cannot be larger than the number of points
+    self.assertRaises(ValueError, tree.query, x, 101)
+
+  def test_kdtree_workers(self):
+    np.random.seed(1)
+    pnts = np.random.random((100,2))
+    x = np.random.random((20,2))
+    tree = rbf.utils.KDTree(pnts)
+    # querying with one worker and with all available workers should give
+    # the same neighbors
+    dist1, idx1 = tree.query(x, 3, workers=1)
+    dist2, idx2 = tree.query(x, 3, workers=-1)
+    self.assertTrue(np.all(idx1 == idx2))
+    self.assertTrue(np.allclose(dist1, dist2))
       
 
     